@@ -1,18 +1,87 @@
 """AGUI Reasoning Engine - Intent classification and insight extraction."""
 
-from typing import Literal, Optional
-from pydantic import BaseModel
+import asyncio
+import functools
+import re
+from dataclasses import dataclass
+from typing import Literal, Optional, Sequence
 
 
-class Intent(BaseModel):
+# Unified keyword matchers: every category's keywords live in one
+# compiled alternation, so a query is scanned once for all categories
+# instead of once per category. Group names double as category names;
+# the priority maps preserve the old per-category check order.
+_INTENT_RE = re.compile(
+    r"(?P<overview>overview|summary|dashboard)"
+    r"|(?P<trend>trend|over time|growth|progress)"
+    r"|(?P<comparison>compare|vs|versus|between)"
+    r"|(?P<highlight>highlight|best|top|most)"
+    r"|(?P<deep_dive>deep dive|detailed|analyze|breakdown)",
+    re.IGNORECASE
+)
+_INTENT_PRIORITY = {
+    "overview": 0,
+    "trend": 1,
+    "comparison": 2,
+    "highlight": 3,
+    "deep_dive": 4,
+}
+
+_FOCUS_RE = re.compile(r"(?P<github>github)|(?P<activity>activity)", re.IGNORECASE)
+_FOCUS_PRIORITY = {"github": 0, "activity": 1}
+
+
+def _best_category(
+    pattern: re.Pattern[str],
+    priority: dict[str, int],
+    text: str
+) -> Optional[str]:
+    """Find the highest-priority category whose keywords match text.
+
+    Args:
+        pattern: Combined alternation with one named group per category
+        priority: Category name to rank (lower wins)
+        text: Text to scan
+
+    Returns:
+        Best matching category name, or None if nothing matches
+    """
+    best_name = None
+    best_rank = len(priority)
+    for match in pattern.finditer(text):
+        rank = priority[match.lastgroup]
+        if rank < best_rank:
+            best_name = match.lastgroup
+            best_rank = rank
+            if rank == 0:
+                break
+    return best_name
+
+
+# GitHub username extraction: either a word following "for"/"of"/"user"/"@"
+# or a possessive like "octocat's" (plain or curly apostrophe).
+_USERNAME_RE = re.compile(
+    r"(?:\bfor\s+|\bof\s+|\buser\s+|@)([A-Za-z0-9_-]+)"
+    r"|\b([A-Za-z0-9_-]+)['’]s\b",
+    re.IGNORECASE
+)
+
+
+# Brain models are internal value holders that never cross the wire, so
+# plain frozen dataclasses are enough: no per-instance __dict__ (slots),
+# immutability for safe sharing, and zero validation overhead on the
+# per-request construction path.
+@dataclass(slots=True, frozen=True)
+class Intent:
     """Classified user intent."""
     intent_type: Literal["overview", "trend", "comparison", "highlight", "deep_dive"]
     focus_area: Optional[str] = None
     time_scope: Optional[str] = None
     username: Optional[str] = None  # Extracted GitHub username
-    
 
-class Insight(BaseModel):
+
+@dataclass(slots=True, frozen=True)
+class Insight:
     """Extracted insight from data analysis."""
     insight_type: Literal["total", "trend", "ranking", "peak", "outlier", "distribution"]
     title: str
@@ -20,11 +89,87 @@ class Insight(BaseModel):
     context: Optional[str] = None
 
 
-class ReasoningResult(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ReasoningResult:
     """Result of reasoning pipeline."""
     intent: Intent
-    insights: list[Insight]
+    insights: Sequence[Insight]
     summary: str
+    total_count: int = 0  # Number of total-type insights
+
+
+# Sample insights served when no GitHub connector is available.
+# Built once at import time; callers treat insights as read-only, so the
+# shared tuple is returned directly instead of rebuilding ~6 models plus
+# their literal payloads on every request.
+_SAMPLE_INSIGHTS: tuple[Insight, ...] = (
+    Insight(
+        insight_type="total",
+        title="Total Commits",
+        value=312,
+        context="All-time contributions (sample data)"
+    ),
+    Insight(
+        insight_type="total",
+        title="Repositories",
+        value=18,
+        context="Active repositories (sample data)"
+    ),
+    Insight(
+        insight_type="total",
+        title="Top Language",
+        value="Python",
+        context="Most used programming language (sample data)"
+    ),
+    Insight(
+        insight_type="trend",
+        title="Commits Over Time",
+        value=[
+            {"date": "2024-01", "commits": 45},
+            {"date": "2024-02", "commits": 52},
+            {"date": "2024-03", "commits": 38},
+            {"date": "2024-04", "commits": 61},
+            {"date": "2024-05", "commits": 48},
+            {"date": "2024-06", "commits": 68}
+        ],
+        context="Monthly commit activity (sample data)"
+    ),
+    Insight(
+        insight_type="ranking",
+        title="Top Repositories",
+        value=[
+            {"name": "dynQR", "stars": 124, "commits": 87},
+            {"name": "finora-app", "stars": 89, "commits": 56},
+            {"name": "finance_ai", "stars": 67, "commits": 43},
+            {"name": "ag-ui", "stars": 45, "commits": 32},
+            {"name": "portfolio", "stars": 23, "commits": 19}
+        ],
+        context="Repositories by activity and stars (sample data)"
+    ),
+    Insight(
+        insight_type="distribution",
+        title="Language Distribution",
+        value=[
+            {"language": "Python", "percentage": 45},
+            {"language": "TypeScript", "percentage": 30},
+            {"language": "JavaScript", "percentage": 15},
+            {"language": "Dart", "percentage": 10}
+        ],
+        context="Code distribution by language (sample data)"
+    ),
+)
+
+# Counted once at import so the summary never rescans the insight list
+_SAMPLE_TOTAL_COUNT = sum(1 for i in _SAMPLE_INSIGHTS if i.insight_type == "total")
+
+# Summary templates by intent type; unknown intents fall back to the
+# generic "Analyzed ..." form (note its different focus placeholder).
+_SUMMARY_FORMATS = {
+    "overview": "Analyzed {focus}{user} with {n} key metrics",
+    "trend": "Identified trends in {focus}{user}",
+    "highlight": "Highlighted top performers in {focus}{user}",
+}
+_DEFAULT_SUMMARY_FORMAT = "Analyzed {focus}{user}"
 
 
 class AgentBrain:
@@ -53,43 +198,17 @@ class AgentBrain:
         Returns:
             Classified intent with extracted username if found
         """
-        query_lower = query.lower()
-        
-        # Intent classification logic
-        if any(word in query_lower for word in ["overview", "summary", "dashboard"]):
-            intent_type = "overview"
-        elif any(word in query_lower for word in ["trend", "over time", "growth", "progress"]):
-            intent_type = "trend"
-        elif any(word in query_lower for word in ["compare", "vs", "versus", "between"]):
-            intent_type = "comparison"
-        elif any(word in query_lower for word in ["highlight", "best", "top", "most"]):
-            intent_type = "highlight"
-        elif any(word in query_lower for word in ["deep dive", "detailed", "analyze", "breakdown"]):
-            intent_type = "deep_dive"
-        else:
-            # Default to overview
-            intent_type = "overview"
-        
+        # Intent classification: one case-insensitive scan across all
+        # categories, with no lowercased copy of the query allocated
+        intent_type = _best_category(_INTENT_RE, _INTENT_PRIORITY, query) or "overview"
+
         # Extract focus area
-        focus_area = None
-        if "github" in query_lower:
-            focus_area = "github"
-        elif "activity" in query_lower:
-            focus_area = "activity"
-        
+        focus_area = _best_category(_FOCUS_RE, _FOCUS_PRIORITY, query)
+
         # Extract GitHub username from query
-        username = None
-        words = query.split()
-        for i, word in enumerate(words):
-            clean_word = word.rstrip("'s").rstrip("'s")
-            if clean_word.replace("-", "").replace("_", "").isalnum():
-                if i > 0 and words[i-1].lower() in ["for", "of", "user", "@"]:
-                    username = clean_word
-                    break
-                elif word.endswith("'s") or word.endswith("'s"):
-                    username = clean_word
-                    break
-            
+        match = _USERNAME_RE.search(query)
+        username = (match.group(1) or match.group(2)) if match else None
+
         return Intent(
             intent_type=intent_type,
             focus_area=focus_area,
@@ -97,23 +216,25 @@ class AgentBrain:
             username=username
         )
     
-    def extract_insights(self, intent: Intent, username: Optional[str] = None) -> list[Insight]:
+    def extract_insights(
+        self,
+        intent: Intent,
+        username: Optional[str] = None
+    ) -> tuple[Sequence[Insight], int]:
         """Extract insights based on intent.
-        
+
         Fetches real GitHub data if connector available, otherwise uses sample data.
-        
+
         Args:
             intent: Classified intent
             username: Optional GitHub username override
-            
+
         Returns:
-            List of extracted insights
+            Extracted insights and the number of total-type insights
         """
-        insights = []
-        
         # Determine which username to use
         target_user = username or intent.username
-        
+
         # Try to fetch real GitHub data
         if self.github_connector and target_user:
             try:
@@ -122,18 +243,18 @@ class AgentBrain:
             except Exception as e:
                 # Fall back to sample data on error
                 print(f"GitHub API error, using sample data: {e}")
-        
+
         # Fall back to sample data
         return self._get_sample_insights(intent)
-    
-    def _insights_from_github_data(self, data) -> list[Insight]:
+
+    def _insights_from_github_data(self, data) -> tuple[list[Insight], int]:
         """Convert GitHub data to insights.
-        
+
         Args:
             data: GitHubUserData object
-            
+
         Returns:
-            List of insights
+            Insights and the number of total-type insights
         """
         insights = []
         
@@ -158,7 +279,10 @@ class AgentBrain:
             value=data.top_language,
             context="Most used programming language"
         ))
-        
+
+        # The three metrics above are the only total-type insights
+        total_count = 3
+
         # Trend data
         if data.commit_history:
             insights.append(Insight(
@@ -185,95 +309,68 @@ class AgentBrain:
                 value=data.top_repositories,
                 context="Most starred repositories"
             ))
-        
-        return insights
-    
-    def _get_sample_insights(self, intent: Intent) -> list[Insight]:
+
+        return insights, total_count
+
+    def _get_sample_insights(self, intent: Intent) -> tuple[tuple[Insight, ...], int]:
         """Get sample insights as fallback.
-        
+
         Args:
             intent: Classified intent
-            
+
         Returns:
-            List of sample insights
+            Shared tuple of sample insights (treat as read-only) and the
+            number of total-type insights
         """
-        insights = []
-        
-        # For GitHub-focused queries, extract relevant insights
+        # For GitHub-focused queries, serve the precomputed samples
         if intent.focus_area == "github" or intent.intent_type == "overview":
-            # Total metrics
-            insights.append(Insight(
-                insight_type="total",
-                title="Total Commits",
-                value=312,
-                context="All-time contributions (sample data)"
-            ))
-            
-            insights.append(Insight(
-                insight_type="total",
-                title="Repositories",
-                value=18,
-                context="Active repositories (sample data)"
-            ))
-            
-            insights.append(Insight(
-                insight_type="total",
-                title="Top Language",
-                value="Python",
-                context="Most used programming language (sample data)"
-            ))
-            
-            # Trend data
-            insights.append(Insight(
-                insight_type="trend",
-                title="Commits Over Time",
-                value=[
-                    {"date": "2024-01", "commits": 45},
-                    {"date": "2024-02", "commits": 52},
-                    {"date": "2024-03", "commits": 38},
-                    {"date": "2024-04", "commits": 61},
-                    {"date": "2024-05", "commits": 48},
-                    {"date": "2024-06", "commits": 68}
-                ],
-                context="Monthly commit activity (sample data)"
-            ))
-            
-            # Ranking data
-            insights.append(Insight(
-                insight_type="ranking",
-                title="Top Repositories",
-                value=[
-                    {"name": "dynQR", "stars": 124, "commits": 87},
-                    {"name": "finora-app", "stars": 89, "commits": 56},
-                    {"name": "finance_ai", "stars": 67, "commits": 43},
-                    {"name": "ag-ui", "stars": 45, "commits": 32},
-                    {"name": "portfolio", "stars": 23, "commits": 19}
-                ],
-                context="Repositories by activity and stars (sample data)"
-            ))
-            
-            # Distribution data
-            insights.append(Insight(
-                insight_type="distribution",
-                title="Language Distribution",
-                value=[
-                    {"language": "Python", "percentage": 45},
-                    {"language": "TypeScript", "percentage": 30},
-                    {"language": "JavaScript", "percentage": 15},
-                    {"language": "Dart", "percentage": 10}
-                ],
-                context="Code distribution by language (sample data)"
-            ))
-        
-        return insights
+            return _SAMPLE_INSIGHTS, _SAMPLE_TOTAL_COUNT
+
+        return (), 0
     
     def reason(self, query: str, username: Optional[str] = None) -> ReasoningResult:
         """Execute complete reasoning pipeline.
-        
+
         Args:
             query: User's natural language request
             username: Optional GitHub username override
-            
+
+        Returns:
+            Reasoning result with intent and insights
+        """
+        # Without a connector the pipeline is deterministic per query,
+        # so repeat queries are served from the LRU cache
+        if self.github_connector is None:
+            return _reason_offline(query, username)
+
+        return self._reason(query, username)
+
+    async def reason_async(self, query: str, username: Optional[str] = None) -> ReasoningResult:
+        """Run the reasoning pipeline without blocking the event loop.
+
+        Connector-backed reasoning makes synchronous GitHub requests, so
+        it is offloaded to a worker thread; the connectorless path is
+        in-memory work and runs inline.
+
+        Args:
+            query: User's natural language request
+            username: Optional GitHub username override
+
+        Returns:
+            Reasoning result with intent and insights
+        """
+        if self.github_connector is None:
+            return self.reason(query, username)
+
+        return await asyncio.to_thread(self.reason, query, username)
+
+    def _reason(self, query: str, username: Optional[str] = None) -> ReasoningResult:
+        """Run the reasoning pipeline without caching.
+
+        Args:
+            query: User's natural language request
+            username: Optional GitHub username override
+
         Returns:
             Reasoning result with intent and insights
         """
@@ -281,36 +378,58 @@ class AgentBrain:
         intent = self.classify_intent(query)
         
         # Step 2 & 3: Data planning and insight extraction
-        insights = self.extract_insights(intent, username)
-        
+        insights, total_count = self.extract_insights(intent, username)
+
         # Generate summary
-        summary = self._generate_summary(intent, insights)
-        
+        summary = self._generate_summary(intent, total_count)
+
         return ReasoningResult(
             intent=intent,
             insights=insights,
-            summary=summary
+            summary=summary,
+            total_count=total_count
         )
-    
-    def _generate_summary(self, intent: Intent, insights: list[Insight]) -> str:
+
+    def _generate_summary(self, intent: Intent, total_count: int) -> str:
         """Generate human-readable summary of analysis.
-        
+
         Args:
             intent: Classified intent
-            insights: Extracted insights
-            
+            total_count: Number of total-type insights extracted
+
         Returns:
             Summary text
         """
-        total_insights = len([i for i in insights if i.insight_type == "total"])
-        
         username_str = f" for @{intent.username}" if intent.username else ""
-        
-        if intent.intent_type == "overview":
-            return f"Analyzed {intent.focus_area or 'activity'}{username_str} with {total_insights} key metrics"
-        elif intent.intent_type == "trend":
-            return f"Identified trends in {intent.focus_area or 'activity'}{username_str}"
-        elif intent.intent_type == "highlight":
-            return f"Highlighted top performers in {intent.focus_area or 'activity'}{username_str}"
+
+        fmt = _SUMMARY_FORMATS.get(intent.intent_type)
+        if fmt is None:
+            fmt = _DEFAULT_SUMMARY_FORMAT
+            focus = intent.focus_area or "data"
         else:
-            return f"Analyzed {intent.focus_area or 'data'}{username_str}"
+            focus = intent.focus_area or "activity"
+
+        return fmt.format(focus=focus, user=username_str, n=total_count)
+
+
+@functools.lru_cache(maxsize=1024)
+def _reason_offline(query: str, username: Optional[str]) -> ReasoningResult:
+    """Cached reasoning for the connectorless path.
+
+    Without a GitHub connector the pipeline output depends only on the
+    query and username, so results are memoized and repeat queries cost
+    a dict lookup. ReasoningResult is treated as immutable downstream,
+    making it safe to return the same instance.
+
+    Args:
+        query: User's natural language request
+        username: Optional GitHub username override
+
+    Returns:
+        Reasoning result with intent and insights
+    """
+    return _OFFLINE_BRAIN._reason(query, username)
+
+
+# Stateless brain backing the offline cache (no connector attached)
+_OFFLINE_BRAIN = AgentBrain()
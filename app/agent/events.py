@@ -1,7 +1,9 @@
 """AG-UI Event Helpers - Utilities for emitting agent events."""
 
-import json
 from typing import Any
+
+import orjson
+
 from app.schemas.events import (
     AgentMessageEvent,
     AgentLoadingEvent,
@@ -12,17 +14,21 @@ from app.schemas.events import (
 )
 
 
-def format_event(event: AGUIEvent) -> str:
+# SSE framing, kept as bytes so frames go to the transport unconverted
+_PREFIX = b"data: "
+_SUFFIX = b"\n\n"
+
+
+def format_event(event: AGUIEvent) -> bytes:
     """Format an AG-UI event for Server-Sent Events (SSE) streaming.
-    
+
     Args:
         event: AG-UI event to format
-        
+
     Returns:
-        SSE-formatted event string
+        SSE-formatted event frame as bytes
     """
-    event_json = event.model_dump_json()
-    return f"data: {event_json}\n\n"
+    return _PREFIX + orjson.dumps(event.model_dump()) + _SUFFIX
 
 
 def create_loading_event(message: str = "Processing...") -> AgentLoadingEvent:
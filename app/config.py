@@ -1,31 +1,45 @@
 """Configuration management for Anti Gravity agent system."""
 
-from pydantic_settings import BaseSettings
+import functools
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional
 
 
 class Settings(BaseSettings):
     """Application settings."""
-    
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        case_sensitive=True,
+        frozen=True
+    )
+
     # Server configuration
     APP_NAME: str = "AGUI"
     APP_VERSION: str = "0.1.0"
     DEBUG: bool = True
-    
+
     # CORS settings
     CORS_ORIGINS: list[str] = ["http://localhost:3000", "http://localhost:5173"]
-    
+
     # Agent configuration
     STREAM_DELAY: float = 0.1  # Delay between events for demonstration
-    
+
     # GitHub configuration
     GITHUB_TOKEN: Optional[str] = None
+    GITHUB_TOKENS: list[str] = []  # Optional token pool for quota rotation
     GITHUB_DEFAULT_USER: str = "octocat"
     CACHE_TTL: int = 300  # 5 minutes
-    
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
 
 
-settings = Settings()
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build the settings singleton, parsing .env only once per process.
+
+    Usable directly or as a cached FastAPI dependency via
+    Depends(get_settings).
+    """
+    return Settings()
+
+
+settings = get_settings()
@@ -1,16 +1,40 @@
 """GitHub Data Connector - Real-time GitHub API integration."""
 
 from typing import Optional, List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from collections import Counter, defaultdict, OrderedDict
+import heapq
+import itertools
+import threading
 import time
 
-try:
-    from github import Github, GithubException
-    GITHUB_AVAILABLE = True
-except ImportError:
-    GITHUB_AVAILABLE = False
+
+# Commit queries are network-latency-bound, so per-repo fetches run on a
+# small thread pool; kept low to stay under GitHub's secondary rate limit.
+_MAX_CONCURRENT_FETCHES = 5
+
+# Stop issuing requests on a token whose remaining quota drops below
+# this buffer, leaving headroom for in-flight concurrent fetches.
+_RATE_LIMIT_BUFFER = 100
+
+# How many repositories the commit scan walks, and the sort fallback
+# for repos that have never been pushed (PyGithub dates are UTC-aware)
+_COMMIT_SCAN_REPOS = 10
+_NEVER_PUSHED = datetime.min.replace(tzinfo=timezone.utc)
+
+# Upper bound on cached usernames; the least recently used entry is
+# evicted once the cache fills.
+_CACHE_MAX_ENTRIES = 1024
+
+
+class RateLimitError(Exception):
+    """Raised when every configured token is out of API quota."""
+
+    def __init__(self, reset_at: int):
+        super().__init__(f"GitHub rate limit exhausted; resets at {reset_at}")
+        self.reset_at = reset_at
 
 
 @dataclass
@@ -28,19 +52,98 @@ class GitHubUserData:
 class GitHubConnector:
     """GitHub API connector with caching and error handling."""
     
-    def __init__(self, token: Optional[str] = None, cache_ttl: int = 300):
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        cache_ttl: int = 300,
+        tokens: Optional[List[str]] = None
+    ):
         """Initialize GitHub connector.
-        
+
         Args:
             token: GitHub personal access token (optional)
             cache_ttl: Cache time-to-live in seconds
+            tokens: Optional token pool; requests rotate to whichever
+                token has the most quota left
         """
-        if not GITHUB_AVAILABLE:
+        # PyGithub drags in requests/urllib3/cryptography, so defer the
+        # import until a connector is actually constructed instead of
+        # paying for it on every app import
+        try:
+            from github import Github, GithubException
+        except ImportError:
             raise ImportError("PyGithub not installed. Run: pip install PyGithub")
-        
-        self.github = Github(token) if token else Github()
-        self.cache: Dict[str, tuple[GitHubUserData, float]] = {}
+        self._GithubException = GithubException
+
+        # Optional on-disk HTTP cache: when requests-cache is installed,
+        # patching requests before the clients build their sessions
+        # makes PyGithub serve repeat page fetches from SQLite and
+        # revalidate via conditional requests, so a warm process mostly
+        # sees 304s - which don't count against the rate limit - and
+        # the cache survives worker restarts. Without the package the
+        # connector behaves as before.
+        try:
+            import requests_cache
+            requests_cache.install_cache(
+                "gh_cache",
+                backend="sqlite",
+                expire_after=cache_ttl,
+                cache_control=True
+            )
+        except ImportError:
+            pass
+
+        # One client per token, each with a urllib3 pool shared across
+        # its API calls (sized for the concurrent commit fetches) so
+        # paginated requests reuse connections instead of paying a TLS
+        # handshake each; 100-item pages and no inter-request pause cut
+        # the pagination round trips
+        pool_tokens = list(tokens) if tokens else [token]
+        self._clients = [
+            Github(
+                pool_token,
+                per_page=100,
+                pool_size=20,
+                seconds_between_requests=0
+            )
+            for pool_token in pool_tokens
+        ]
+        self.github = self._clients[0]
+        # username -> (data, user object carrying its ETag, timestamp),
+        # in least-recently-used-first order and capped at
+        # _CACHE_MAX_ENTRIES so the cache can't grow without bound
+        self.cache: OrderedDict[str, tuple[GitHubUserData, Any, float]] = OrderedDict()
         self.cache_ttl = cache_ttl
+        # Per-username refresh locks: concurrent requests for the same
+        # expired user wait for one refetch instead of each issuing one
+        self._locks: Dict[str, threading.Lock] = {}
+
+    def _pick_client(self):
+        """Select the client with the most remaining API quota.
+
+        Quota counters come from each client's last response headers, so
+        picking costs no extra API call; clients that haven't issued a
+        request yet are assumed fresh.
+
+        Returns:
+            Github client to use for the next request
+
+        Raises:
+            RateLimitError: If every client is below the quota buffer
+        """
+        def remaining(client) -> float:
+            # requester.rate_limiting is tracked from response headers;
+            # unlike Github.rate_limiting it never issues a request
+            left = client.requester.rate_limiting[0]
+            return left if left >= 0 else float("inf")
+
+        best = max(self._clients, key=remaining)
+        best_remaining = remaining(best)
+        if best_remaining < _RATE_LIMIT_BUFFER:
+            reset_at = min(c.requester.rate_limiting_resettime for c in self._clients)
+            raise RateLimitError(reset_at)
+
+        return best
     
     def get_user_data(self, username: str) -> GitHubUserData:
         """Fetch comprehensive user data from GitHub.
@@ -53,170 +156,258 @@ class GitHubConnector:
             
         Raises:
             GithubException: If user not found or API error
+            RateLimitError: If every token is out of API quota
         """
-        # Check cache
-        if username in self.cache:
-            data, timestamp = self.cache[username]
-            if time.time() - timestamp < self.cache_ttl:
+        # Fresh cache entries are served without locking; a hit also
+        # refreshes the entry's LRU position
+        cached = self.cache.get(username)
+        if cached is not None and time.time() - cached[2] < self.cache_ttl:
+            self.cache.move_to_end(username)
+            return cached[0]
+
+        # One refresh per username at a time: whoever takes the lock
+        # does the work, the rest find the fresh entry on recheck.
+        # dict.setdefault is atomic, so racing threads share one lock.
+        lock = self._locks.setdefault(username, threading.Lock())
+        with lock:
+            cached = self.cache.get(username)
+            if cached is not None:
+                data, user, timestamp = cached
+                if time.time() - timestamp < self.cache_ttl:
+                    # Another thread refreshed while we waited
+                    self.cache.move_to_end(username)
+                    return data
+                # Expired: revalidate with a conditional request
+                # (If-None-Match via the stored user ETag) before paying
+                # for a full refetch - 304 responses don't count against
+                # the rate limit. The user profile is a proxy for
+                # freshness, so slow-moving activity may be served
+                # slightly stale, same as with the previous fixed TTL.
+                try:
+                    if not user.update():
+                        # 304 Not Modified: bump the timestamp, keep the data
+                        self._store(username, data, user)
+                        return data
+                except Exception:
+                    pass  # Revalidation failed; fall through to a full fetch
+
+            # Fetch fresh data on the token with the most quota left
+            try:
+                user = self._pick_client().get_user(username)
+                # Sort server-side by recent pushes and stop after 100 repos
+                # (one page at per_page=100) rather than paginating through
+                # the user's entire repo list; the most recently pushed
+                # repos are also the best commit-scan candidates
+                repos = list(itertools.islice(
+                    user.get_repos(sort="pushed", direction="desc"),
+                    100
+                ))
+
+                # Calculate metrics; one commit scan feeds both the total
+                # and the history, and one repo scan feeds the language,
+                # count and top-repository metrics
+                total_commits, monthly_commits = self._scan_recent_commits(user, repos)
+                language_counts, repo_count, top_repos = self._scan_repos(repos)
+                top_language = (
+                    language_counts.most_common(1)[0][0] if language_counts else "Unknown"
+                )
+                commit_history = self._build_commit_history(monthly_commits)
+                language_distribution = self._get_language_distribution(language_counts)
+                top_repositories = self._get_top_repositories(top_repos)
+
+                # Create data object
+                data = GitHubUserData(
+                    username=username,
+                    total_commits=total_commits,
+                    repo_count=repo_count,
+                    top_language=top_language,
+                    commit_history=commit_history,
+                    language_distribution=language_distribution,
+                    top_repositories=top_repositories
+                )
+
+                # Cache it
+                self._store(username, data, user)
+
                 return data
-        
-        # Fetch fresh data
-        try:
-            user = self.github.get_user(username)
-            repos = list(user.get_repos())
-            
-            # Calculate metrics
-            total_commits = self._count_user_commits(user, repos)
-            repo_count = len([r for r in repos if not r.fork])
-            top_language = self._get_top_language(repos)
-            commit_history = self._get_commit_history(user, repos)
-            language_distribution = self._get_language_distribution(repos)
-            top_repositories = self._get_top_repositories(repos)
-            
-            # Create data object
-            data = GitHubUserData(
-                username=username,
-                total_commits=total_commits,
-                repo_count=repo_count,
-                top_language=top_language,
-                commit_history=commit_history,
-                language_distribution=language_distribution,
-                top_repositories=top_repositories
-            )
-            
-            # Cache it
-            self.cache[username] = (data, time.time())
-            
-            return data
-            
-        except GithubException as e:
-            raise Exception(f"GitHub API error: {e.status} - {e.data.get('message', 'Unknown error')}")
+
+            except self._GithubException as e:
+                raise Exception(f"GitHub API error: {e.status} - {e.data.get('message', 'Unknown error')}")
+
+    def _store(self, username: str, data: GitHubUserData, user) -> None:
+        """Insert a cache entry, evicting the oldest one past the cap.
+
+        Args:
+            username: Cache key
+            data: Computed user data
+            user: GitHub user object carrying its ETag
+        """
+        self.cache[username] = (data, user, time.time())
+        self.cache.move_to_end(username)
+        if len(self.cache) > _CACHE_MAX_ENTRIES:
+            self.cache.popitem(last=False)
     
-    def _count_user_commits(self, user, repos: List) -> int:
-        """Count total commits by user across all repos.
-        
+    def _scan_recent_commits(self, user, repos: List, months: int = 6) -> tuple[int, Dict[str, int]]:
+        """Walk recent commits once per repo, accumulating both metrics.
+
+        A single pass per repository feeds the commit total and the
+        monthly histogram, halving the API traffic of fetching them
+        separately.
+
         Args:
             user: GitHub user object
             repos: List of repositories
-            
+            months: Number of months to analyze
+
         Returns:
-            Total commit count
+            Total commit count and a month-keyed commit histogram
         """
-        total = 0
-        # Sample recent commits from user's repos
-        for repo in repos[:10]:  # Limit to avoid rate limiting
+        cutoff_date = datetime.now() - timedelta(days=months * 30)
+
+        def scan_one(repo) -> tuple[int, Dict[int, int]]:
+            total = 0
+            counts: Dict[int, int] = defaultdict(int)
             try:
-                commits = repo.get_commits(author=user, since=datetime.now() - timedelta(days=365))
-                total += commits.totalCount
-            except:
-                continue
-        return total
+                for commit in repo.get_commits(author=user, since=cutoff_date):
+                    total += 1
+                    # Integer month key (year*12 + month): two attribute
+                    # reads and an add per commit instead of a strftime
+                    date = commit.commit.author.date
+                    counts[date.year * 12 + date.month] += 1
+            except self._GithubException as e:
+                # A rate-limited 403 must surface so callers can back
+                # off; other API errors (409 for an empty repo, blocked
+                # access) just contribute no commits for this repo.
+                # Anything that isn't a GithubException propagates.
+                if e.status == 403 and "rate limit" in str(e.data).lower():
+                    headers = e.headers or {}
+                    raise RateLimitError(int(headers.get("x-ratelimit-reset", 0)))
+            return total, counts
+
+        # Spend the limited scan budget on the most recently pushed
+        # repos - the best predictor of where recent commits live -
+        # rather than whatever order the repo list happens to arrive in
+        scan_set = heapq.nlargest(
+            _COMMIT_SCAN_REPOS,
+            repos,
+            key=lambda r: r.pushed_at or _NEVER_PUSHED
+        )
+
+        # Scan each repo's commits concurrently, then merge the per-repo
+        # results; the scan set is kept small to avoid rate limiting
+        total_commits = 0
+        monthly_commits: Dict[int, int] = defaultdict(int)
+        with ThreadPoolExecutor(max_workers=_MAX_CONCURRENT_FETCHES) as pool:
+            for total, counts in pool.map(scan_one, scan_set):
+                total_commits += total
+                for month, count in counts.items():
+                    monthly_commits[month] += count
+
+        return total_commits, monthly_commits
     
-    def _get_top_language(self, repos: List) -> str:
-        """Get user's most used language.
-        
+    def _scan_repos(self, repos: List, limit: int = 5) -> tuple[Counter, int, List]:
+        """Collect all repo-level metrics in a single pass.
+
+        One traversal builds the language counts, the non-fork count and
+        a top-k-by-stars heap, replacing the separate scans each metric
+        used to make over the same list.
+
         Args:
             repos: List of repositories
-            
+            limit: Number of top-starred repos to keep
+
         Returns:
-            Top language name
+            Language counts, non-fork repo count, and the top-starred
+            non-fork repos in descending star order
         """
-        language_counts = defaultdict(int)
-        
-        for repo in repos:
+        language_counts: Counter = Counter()
+        non_fork_count = 0
+        # Heap entries carry -index so star ties resolve to the earlier
+        # repo, matching heapq.nlargest's stability
+        stars_heap: list[tuple[int, int, Any]] = []
+
+        for index, repo in enumerate(repos):
             if repo.language:
                 language_counts[repo.language] += 1
-        
-        if not language_counts:
-            return "Unknown"
-        
-        return max(language_counts.items(), key=lambda x: x[1])[0]
-    
-    def _get_commit_history(self, user, repos: List, months: int = 6) -> List[Dict[str, Any]]:
-        """Get commit activity over time.
-        
+            if not repo.fork:
+                non_fork_count += 1
+                entry = (repo.stargazers_count, -index, repo)
+                if len(stars_heap) < limit:
+                    heapq.heappush(stars_heap, entry)
+                else:
+                    heapq.heappushpop(stars_heap, entry)
+
+        top_repos = [entry[2] for entry in sorted(stars_heap, reverse=True)]
+
+        return language_counts, non_fork_count, top_repos
+
+
+    def _build_commit_history(self, monthly_commits: Dict[int, int], months: int = 6) -> List[Dict[str, Any]]:
+        """Format a monthly commit histogram as chart data.
+
         Args:
-            user: GitHub user object
-            repos: List of repositories
-            months: Number of months to analyze
-            
+            monthly_commits: Integer-month-keyed commit counts from the scan
+            months: Number of months to include
+
         Returns:
             List of {date, commits} dictionaries
         """
-        # Group commits by month
-        monthly_commits = defaultdict(int)
-        cutoff_date = datetime.now() - timedelta(days=months * 30)
-        
-        for repo in repos[:10]:  # Limit to avoid rate limiting
-            try:
-                commits = repo.get_commits(author=user, since=cutoff_date)
-                for commit in commits:
-                    month = commit.commit.author.date.strftime("%Y-%m")
-                    monthly_commits[month] += 1
-            except:
-                continue
-        
-        # Convert to sorted list
+        # Convert to sorted list; "%Y-%m" labels are only formatted for
+        # the handful of output rows, never per commit
+        now = datetime.now()
         result = []
         for i in range(months):
-            date = (datetime.now() - timedelta(days=i * 30)).strftime("%Y-%m")
+            date = now - timedelta(days=i * 30)
             result.append({
-                "date": date,
-                "commits": monthly_commits.get(date, 0)
+                "date": date.strftime("%Y-%m"),
+                "commits": monthly_commits.get(date.year * 12 + date.month, 0)
             })
-        
+
         return sorted(result, key=lambda x: x["date"])
     
-    def _get_language_distribution(self, repos: List) -> List[Dict[str, Any]]:
+    def _get_language_distribution(self, language_counts: Counter) -> List[Dict[str, Any]]:
         """Get distribution of languages used.
-        
+
         Args:
-            repos: List of repositories
-            
+            language_counts: Per-language repo counts from the repo scan
+
         Returns:
             List of {language, percentage} dictionaries
         """
-        language_counts = defaultdict(int)
-        
-        for repo in repos:
-            if repo.language:
-                language_counts[repo.language] += 1
-        
         if not language_counts:
             return []
-        
+
         total = sum(language_counts.values())
-        
-        result = [
+
+        # most_common keeps only the top 5 without a full sort; the
+        # rounded percentage stays in integer arithmetic throughout
+        half = total // 2
+        return [
             {
                 "language": lang,
-                "percentage": round((count / total) * 100)
+                "percentage": (count * 100 + half) // total
             }
-            for lang, count in language_counts.items()
+            for lang, count in language_counts.most_common(5)
         ]
-        
-        return sorted(result, key=lambda x: x["percentage"], reverse=True)[:5]
     
-    def _get_top_repositories(self, repos: List, limit: int = 5) -> List[Dict[str, Any]]:
-        """Get top repositories by stars.
-        
+    def _get_top_repositories(self, top_repos: List) -> List[Dict[str, Any]]:
+        """Build table rows for the top-starred repositories.
+
         Args:
-            repos: List of repositories
-            limit: Number of repos to return
-            
+            top_repos: Top-starred repos from the repo scan
+
         Returns:
             List of {name, stars, commits} dictionaries
         """
-        # Filter out forks and sort by stars
-        non_fork_repos = [r for r in repos if not r.fork]
-        sorted_repos = sorted(non_fork_repos, key=lambda r: r.stargazers_count, reverse=True)
-        
         result = []
-        for repo in sorted_repos[:limit]:
+        for repo in top_repos:
+            # One listing per repo; totalCount reads the count from the
+            # pagination headers without walking the pages
+            total = repo.get_commits().totalCount
             result.append({
                 "name": repo.name,
                 "stars": repo.stargazers_count,
-                "commits": repo.get_commits().totalCount if repo.get_commits().totalCount < 1000 else "1000+"
+                "commits": total if total < 1000 else "1000+"
             })
-        
+
         return result
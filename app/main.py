@@ -23,7 +23,8 @@ try:
     from app.connectors.github_connector import GitHubConnector
     github_connector = GitHubConnector(
         token=settings.GITHUB_TOKEN,
-        cache_ttl=settings.CACHE_TTL
+        cache_ttl=settings.CACHE_TTL,
+        tokens=settings.GITHUB_TOKENS or None
     )
 except Exception as e:
     print(f"GitHub connector unavailable: {e}")
@@ -57,59 +58,78 @@ brain = AgentBrain(github_connector=github_connector)
 ui_decider = UIDecider()
 
 
-async def agent_stream(query: str, username: Optional[str] = None) -> AsyncGenerator[str, None]:
+# Sentinel closing the event queue when the producer is done
+_STREAM_DONE = object()
+
+# The loading messages never change, so their SSE frames are serialized
+# once at import and the cached bytes are reused on every request
+_EVT_ANALYZING = format_event(create_loading_event("Analyzing your request..."))
+_EVT_EXTRACTING = format_event(create_loading_event("Extracting insights..."))
+_EVT_COMPOSING = format_event(create_loading_event("Composing dashboard..."))
+
+
+async def agent_stream(query: str, username: Optional[str] = None) -> AsyncGenerator[bytes, None]:
     """Generate AG-UI event stream for a query.
-    
+
     Pipeline:
     1. Emit loading event
     2. Reason about query (intent + insights)
     3. Decide UI components
     4. Emit message event with summary
     5. Emit render event with A2UI dashboard
-    
+
+    The pipeline runs in a producer task feeding a bounded queue while
+    this generator drains it, so each event flushes to the client as
+    soon as its stage completes instead of waiting on the consumer.
+
     Args:
         query: User's natural language query
         username: Optional GitHub username
-        
+
     Yields:
         SSE-formatted AG-UI events
     """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=8)
+
+    async def produce() -> None:
+        try:
+            # Step 1: Emit loading
+            await queue.put(_EVT_ANALYZING)
+
+            # Step 2: Reasoning
+            await queue.put(_EVT_EXTRACTING)
+
+            # GitHub-backed reasoning runs in a worker thread so other
+            # requests keep streaming while PyGithub blocks on I/O
+            reasoning = await brain.reason_async(query, username)
+
+            # Step 3: UI Decision
+            await queue.put(_EVT_COMPOSING)
+
+            dashboard = ui_decider.decide_ui(reasoning)
+
+            # Step 4: Emit summary message
+            await queue.put(format_event(create_message_event(reasoning.summary)))
+
+            # Step 5: Emit dashboard
+            await queue.put(format_event(create_render_event(dashboard)))
+
+        except Exception as e:
+            # Handle errors gracefully
+            await queue.put(format_event(create_error_event(
+                error=str(e),
+                code="PROCESSING_ERROR"
+            )))
+        finally:
+            await queue.put(_STREAM_DONE)
+
+    producer = asyncio.create_task(produce())
     try:
-        # Step 1: Emit loading
-        loading_event = create_loading_event("Analyzing your request...")
-        yield format_event(loading_event)
-        await asyncio.sleep(settings.STREAM_DELAY)
-        
-        # Step 2: Reasoning
-        loading_event = create_loading_event("Extracting insights...")
-        yield format_event(loading_event)
-        await asyncio.sleep(settings.STREAM_DELAY)
-        
-        reasoning = brain.reason(query, username)
-        
-        # Step 3: UI Decision
-        loading_event = create_loading_event("Composing dashboard...")
-        yield format_event(loading_event)
-        await asyncio.sleep(settings.STREAM_DELAY)
-        
-        dashboard = ui_decider.decide_ui(reasoning)
-        
-        # Step 4: Emit summary message
-        message_event = create_message_event(reasoning.summary)
-        yield format_event(message_event)
-        await asyncio.sleep(settings.STREAM_DELAY)
-        
-        # Step 5: Emit dashboard
-        render_event = create_render_event(dashboard)
-        yield format_event(render_event)
-        
-    except Exception as e:
-        # Handle errors gracefully
-        error_event = create_error_event(
-            error=str(e),
-            code="PROCESSING_ERROR"
-        )
-        yield format_event(error_event)
+        while (event := await queue.get()) is not _STREAM_DONE:
+            yield event
+    finally:
+        # Client disconnects cancel the generator; stop the producer too
+        producer.cancel()
 
 
 @app.post("/agent/stream")
@@ -159,7 +179,7 @@ async def root():
         },
         "protocol": "AG-UI",
         "specification": "A2UI",
-        "github_connected": gh boolean_connector is not None
+        "github_connected": github_connector is not None
     }
 
 
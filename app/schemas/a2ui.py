@@ -1,7 +1,9 @@
 """A2UI Component Schemas - UI specification language for self-assembling dashboards."""
 
-from pydantic import BaseModel, Field
-from typing import Literal, Any, Optional
+from __future__ import annotations
+
+from pydantic import BaseModel, Field, TypeAdapter
+from typing import Annotated, Literal, Any, Optional, Union
 
 
 class KPICard(BaseModel):
@@ -74,14 +76,14 @@ class Grid(BaseModel):
     """Grid layout container."""
     type: Literal["grid"] = "grid"
     columns: int = Field(description="Number of columns", ge=1, le=12)
-    children: list[Any] = Field(description="Child components")
+    children: list[A2UIComponent] = Field(description="Child components")
 
 
 class Section(BaseModel):
     """Section container for grouping related components."""
     type: Literal["section"] = "section"
     title: Optional[str] = Field(None, description="Section title")
-    children: list[Any] = Field(description="Child components")
+    children: list[A2UIComponent] = Field(description="Child components")
 
 
 class Dashboard(BaseModel):
@@ -89,19 +91,38 @@ class Dashboard(BaseModel):
     type: Literal["dashboard"] = "dashboard"
     title: str = Field(description="Dashboard title")
     subtitle: Optional[str] = Field(None, description="Dashboard subtitle")
-    children: list[Any] = Field(description="Dashboard components")
-
-
-# Union type for all A2UI components
-A2UIComponent = (
-    Dashboard |
-    Section |
-    Grid |
-    KPICard |
-    LineChart |
-    BarChart |
-    PieChart |
-    Table |
-    Text |
-    Divider
-)
+    children: list[A2UIComponent] = Field(description="Dashboard components")
+
+
+# Union type for all A2UI components, discriminated on the "type"
+# literal so validation dispatches straight to the right model instead
+# of trying every variant
+A2UIComponent = Annotated[
+    Union[
+        Dashboard,
+        Section,
+        Grid,
+        KPICard,
+        LineChart,
+        BarChart,
+        PieChart,
+        Table,
+        Text,
+        Divider
+    ],
+    Field(discriminator="type")
+]
+
+# Resolve the forward references on the container models now that the
+# union exists
+Grid.model_rebuild()
+Section.model_rebuild()
+Dashboard.model_rebuild()
+
+
+# Precompiled adapters for validating/serializing specs, built once at
+# import so their pydantic-core schema compilation never lands on a
+# request. The SSE render path streams prebuilt dicts directly; these
+# are the canonical entry points wherever a spec does need checking.
+DASHBOARD_ADAPTER: TypeAdapter[Dashboard] = TypeAdapter(Dashboard)
+COMPONENT_ADAPTER: TypeAdapter[A2UIComponent] = TypeAdapter(A2UIComponent)